@@ -3,16 +3,144 @@ Zero Dependecy Abstraction Layer to run Python scripts in Blender.
 """
 from __future__ import annotations
 from argparse import ArgumentParser
+from asyncio import Semaphore, create_subprocess_exec, gather
+from base64 import b64encode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from http.client import HTTPResponse, HTTPSConnection
+from io import StringIO
+from os import cpu_count, environ, replace
+from pathlib import Path
+from queue import Empty, Full, LifoQueue
+from re import fullmatch
 from sys import argv
-from subprocess import Popen, PIPE, STDOUT
-from tempfile import TemporaryDirectory
-from typing import Any, Dict, Iterable, String, List
-from urllib import request
-from json import loads
-
-# ToDo; provide option to use the official Blender Module instead of the Blender Binary.
+from subprocess import DEVNULL, Popen, PIPE, STDOUT
+from shutil import which
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from traceback import print_exc
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+from json import dumps, loads
+
+# When the official Blender Module can be imported, scripts run in-process.
 # https://github.com/TylerGubala/blenderpy
 
+GITHUB_HOST = "api.github.com"
+GIST_ID = r"[0-9a-fA-F]+"
+GIST_CACHE_SIZE = 128
+
+# Keep-alive connections to GitHub, shared by every `Blender` instance so the
+# TCP and TLS handshakes are only paid once per connection.
+_CONNECTIONS: LifoQueue[HTTPSConnection] = LifoQueue(maxsize=16)
+
+REDIRECTS = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+
+def _github_connect() -> HTTPSConnection:
+    """Open a connection to GitHub, tunnelled through the `https_proxy` if set.
+
+    Raises:
+        ValueError: The proxy is not an http:// proxy.
+    """
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(GITHUB_HOST):
+        return HTTPSConnection(GITHUB_HOST, timeout=10)
+
+    proxy = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    if proxy.scheme != "http":
+        # `set_tunnel` sends its CONNECT in cleartext, so TLS to the proxy
+        # itself is not supported.
+        raise ValueError(f"Only http:// proxies are supported, got {proxy.scheme}://.")
+
+    headers = {}
+    if proxy.username:
+        credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        token = b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+
+    connection = HTTPSConnection(proxy.hostname, proxy.port or 80, timeout=10)
+    connection.set_tunnel(GITHUB_HOST, headers=headers)
+    return connection
+
+
+def _github_request(
+    path: str, headers: Dict[str, str]
+) -> Tuple[HTTPResponse, bytes]:
+    """Send a single GET over a pooled connection, see `_github_get`."""
+    try:
+        connection = _CONNECTIONS.get_nowait()
+        reused = True
+    except Empty:
+        connection = _github_connect()
+        reused = False
+
+    try:
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+    except ConnectionError:
+        connection.close()
+        if not reused:
+            raise
+        # The server dropped an idle keep-alive connection; retry on a new one.
+        return _github_request(path, headers)
+    except Exception:
+        connection.close()
+        raise
+
+    if response.will_close:
+        connection.close()
+    else:
+        try:
+            _CONNECTIONS.put_nowait(connection)
+        except Full:
+            connection.close()
+
+    return response, body
+
+
+def _github_get(
+    path: str, headers: Dict[str, str] | None = None
+) -> Tuple[HTTPResponse, bytes]:
+    """GET a GitHub API path over a pooled connection.
+
+    Set the `GITHUB_TOKEN` environment variable to authenticate, which raises
+    the rate limit from 60 to 5000 requests per hour. Redirects within the
+    GitHub API are followed; a redirect to another host is returned as is.
+
+    Args:
+        path (str): The API path, e.g. '/gists/<id>'.
+        headers (dict): Extra request headers.
+
+    Returns:
+        The (already read) response and its body.
+    """
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "blenderpy",
+        **(headers or {}),
+    }
+    if environ.get("GITHUB_TOKEN"):
+        headers["Authorization"] = f"token {environ['GITHUB_TOKEN']}"
+
+    for _ in range(MAX_REDIRECTS + 1):
+        response, body = _github_request(path, headers)
+        location = response.headers.get("Location")
+        if response.status not in REDIRECTS or not location:
+            break
+
+        target = urlsplit(urljoin(f"https://{GITHUB_HOST}{path}", location))
+        if target.hostname != GITHUB_HOST:
+            break
+        path = f"{target.path}?{target.query}" if target.query else target.path
+
+    return response, body
+
 
 class Blender:
 
@@ -29,7 +157,9 @@ class Blender:
     ```
     """
 
-    def __init__(self, app: String = "blender") -> Blender:
+    def __init__(
+        self, app: str = "blender", cache_dir: str | None = None
+    ) -> Blender:
         """
         Set the `path` parameter to the executable if you have not
         set the PATH variable on your machine. Otherwise the default
@@ -37,150 +167,536 @@ class Blender:
 
         Args:
             path (str): The path to the Blender executable.
-            allow_gist (bool): Allow the programmatic access of gists.
+            cache_dir (str): Directory to cache downloaded gists and their
+                        scripts in, e.g. '~/.cache/blenderpy/gists'.
+                        By default gists are only cached in memory.
 
         Returns:
             Blender Object
         """
         self.app = app
-
-    def terminal(self, cmd: String, **kwargs) -> String:
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._gist_cache: OrderedDict[str, Tuple[str, dict]] = OrderedDict()
+        self._gist_lock = Lock()
+        self._flag_cache: Dict[Tuple[bool, ...], Tuple[str, ...]] = {}
+        self._executables: Dict[str, str] = {}
+        self.returncode: int | None = None
+
+        try:
+            import bpy  # noqa: F401
+
+            self._inproc = True
+        except ImportError:
+            self._inproc = False
+
+    def terminal(
+        self, cmd: str | List[str], stream: bool = False, **kwargs
+    ) -> str | Iterator[str]:
         """Run a Terminal command using popen.
 
         Args:
-            cmd (str): The command to run.
+            cmd (list): The command to run, as an argument list.
+                        A string is only accepted with `shell=True`.
+            stream (bool): Yield the output line by line instead of
+                        returning it once the command has finished.
             kwargs (dict): Keyword arguments to pass to the `Popen` object.
 
         Returns:
             The terminal output.
         """
-        return (
-            Popen(
-                cmd,
-                shell=kwargs.get("shell", True),
-                stdin=kwargs.get("stdin", PIPE),
-                close_fds=kwargs.get("close_fds", True),
-                stdout=kwargs.get("stdout", PIPE),
-                stderr=kwargs.get("stderr", STDOUT),
-            )
-            .stdout.read()
-            .decode("utf8")
+        process = Popen(
+            cmd,
+            shell=kwargs.get("shell", False),
+            stdin=kwargs.get("stdin", PIPE),
+            close_fds=kwargs.get("close_fds", True),
+            stdout=kwargs.get("stdout", PIPE),
+            stderr=kwargs.get("stderr", STDOUT),
+            bufsize=-1,
+            encoding="utf-8",
         )
 
-    def speak(self, text: String | Iterable) -> None:
+        if stream:
+            return self._stream(process)
+
+        output, _ = process.communicate()
+        self.returncode = process.returncode
+        return output or ""
+
+    def _stream(self, process: Popen) -> Iterator[str]:
+        """Yield the output lines of a running process, then reap it."""
+        with process:
+            if process.stdin:
+                process.stdin.close()
+            yield from process.stdout or ()
+        self.returncode = process.returncode
+
+    def speak(self, text: str | Iterable) -> None:
         """Print/Logging wrapper. Allowing quick and easy
         customizations.
 
         Args:
-            text (str): The information to print/log
+            text (str): The information to print/log, or an iterable
+                        of words to join with spaces.
         """
-        if isinstance(text, Iterable):
-            if not any((isinstance(word, str) for word in text)):
-                raise ValueError("I only use strings.")
-            shout = " ".join(text)
+        if isinstance(text, str):
+            shout = text
+        elif isinstance(text, Iterable):
+            try:
+                shout = " ".join(text)
+            except TypeError:
+                raise ValueError("I only use strings.") from None
         else:
             shout = text
 
         print(shout)
 
-    def get_gist(self, gid: String) -> Dict[str, str]:
+    def get_gist(self, gid: str, refresh: bool = False) -> Dict[str, str]:
         """Download a Gist from GitHub.
 
+        Responses are cached by Gist id. A Gist is only downloaded once
+        per `Blender` object; a Gist cached on disk by an earlier session
+        is revalidated with its ETag, so an unchanged Gist is answered
+        with a `304 Not Modified` and no body transfer.
+
         Args:
             gid (str): The UUID for your Gist.
+            refresh (bool): Revalidate the Gist even if it was already
+                        retrieved by this object.
 
         Returns:
             Dict[str, str]: The retrieved JSON from GitHub.
         """
-        base_url = "https://api.github.com/gists/"
+        gid = str(gid)
+        if not fullmatch(GIST_ID, gid):
+            raise ValueError(f"Not a valid Gist id: {gid!r}.")
+
+        etag, gist = self._load_gist(gid)
+        if gist is not None and not refresh and gid in self._gist_cache:
+            return gist
+
+        path = f"/gists/{gid}"
+        response, body = _github_get(path, {"If-None-Match": etag} if etag else {})
+
+        if response.status == 304 and gist is not None:
+            self._remember_gist(gid, etag, gist)
+            return gist
+        if response.status != 200:
+            raise HTTPError(
+                f"https://{GITHUB_HOST}{path}",
+                response.status,
+                response.reason,
+                response.headers,
+                None,
+            )
+
+        etag = response.headers.get("ETag")
+        gist = loads(body.decode("utf-8"))
+        self._store_gist(gid, etag, gist)
+        return gist
 
-        with request.urlopen(base_url + str(gid)) as client:
-            return loads(client.read().decode("utf-8"))
+    def _load_gist(self, gid: str) -> Tuple[str | None, dict | None]:
+        """Get the cached (etag, json) pair of a Gist, from memory or disk.
+
+        Gists read from disk are not remembered until they are revalidated.
+        """
+        with self._gist_lock:
+            if gid in self._gist_cache:
+                self._gist_cache.move_to_end(gid)
+                return self._gist_cache[gid]
+
+        if self.cache_dir is None:
+            return None, None
+
+        try:
+            etag = (self.cache_dir / f"{gid}.etag").read_text(encoding="utf-8")
+            gist = loads((self.cache_dir / f"{gid}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None, None
+
+        return etag, gist
+
+    def _remember_gist(self, gid: str, etag: str | None, gist: dict) -> None:
+        """Keep a Gist in the bounded in-memory cache."""
+        with self._gist_lock:
+            self._gist_cache[gid] = (etag, gist)
+            self._gist_cache.move_to_end(gid)
+            if len(self._gist_cache) > GIST_CACHE_SIZE:
+                self._gist_cache.popitem(last=False)
+
+    def _store_gist(self, gid: str, etag: str | None, gist: dict) -> None:
+        """Cache a freshly downloaded Gist. Without an ETag it can't be revalidated."""
+        self._remember_gist(gid, etag, gist)
+        if self.cache_dir is None or not etag:
+            return
+
+        # The cache is best effort; a read-only home shouldn't break a run.
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for suffix, text in ((".json", dumps(gist)), (".etag", etag)):
+                target = self.cache_dir / f"{gid}{suffix}"
+                partial = target.with_name(target.name + ".part")
+                partial.write_text(text, encoding="utf-8")
+                replace(partial, target)
+        except OSError:
+            pass
 
     def extract_dict_value(
-        self, data: Dict[str, Any], keys: String | List[String]
-    ) -> String | None:
-        """Recursively get the dictionary values from an arbitrarily long keys list."""
+        self, data: Dict[str, Any], keys: str | List[str]
+    ) -> str | None:
+        """Get the dictionary values from an arbitrarily long keys list."""
         if data is None:
             return None
 
         elif isinstance(keys, str):
             return data.get(keys, None)
 
-        return self.extract_dict_value(data.get(keys[0]), keys[1:])
+        for key in keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+
+        return data
 
     def run(
         self,
-        script: String | None = None,
-        binary: String | None = None,
+        script: str | None = None,
+        binary: str | None = None,
         *args,
         **kwargs,
-    ) -> String:
+    ) -> str | Iterator[str]:
         """
         Run a Python script in Blender.
 
+        When the `bpy` module is importable, the script is executed in this
+        process instead of starting Blender. Blender is still started when
+        a `binary` is given, with `inproc=False`, or for settings that
+        need it: `headless=False`, `python=False` or `audio=True`.
+
+        The exit code of Blender, or of the script when run in-process,
+        is kept in `returncode`. A script error shows up as a traceback
+        in the output in both cases.
+
+        In-process output is captured by redirecting `sys.stdout` and
+        `sys.stderr`, so whatever `bpy` writes from C straight to the file
+        descriptors is not part of it. With `stream=True` its lines are
+        only yielded once the script has finished.
+
         Args:
             script (str): The location of your script. Either path or gist id.
             gist (str): Gist UUID to apply.
             binary (str): The Blender binary. Allocated during Object construction.
             args (iterable): All Python arguments to pass into the script.
-                        Should contain one command per string,
-                        formatted like: '-a myfile.txt'
-            kwargs (dict): Optional Blender settings
+                        Should contain one argument per string,
+                        formatted like: '-a', 'my file.txt'
+            kwargs (dict): Optional Blender settings. Pass `inproc=False`
+                        to always start Blender (`inproc=True` has no
+                        effect without `bpy`), `stream=True` to iterate
+                        over the output lines while Blender runs,
+                        `quiet=False` to keep Blender's status lines, or
+                        `capture_output=False` to discard all output.
 
         Returns:
-            String: Terminal output after running the blender command.
+            str: Terminal output after running the blender command,
+                or an iterator over its lines with `stream=True`.
         """
         if binary is not None:
             self.app = binary
-
-        if script is not None:
-            if ".py" not in script:
-                script += ".py"
+        elif self._use_inproc(**kwargs):
+            output = self._run_inproc(self._script(script), *args)
+            if not kwargs.get("capture_output", True):
+                output = ""
+            if kwargs.get("stream", False):
+                return iter(output.splitlines(keepends=True))
+            return output
+
+        if kwargs.get("capture_output", True):
+            pipes = {}
         else:
+            pipes = {"stdout": DEVNULL, "stderr": DEVNULL}
+
+        # Keeping the descriptors open lets `Popen` use `posix_spawn` for the
+        # resolved Blender binary instead of forking this process.
+        return self.terminal(
+            self._command(self.app, script, *args, **kwargs),
+            stream=kwargs.get("stream", False),
+            close_fds=False,
+            **pipes,
+        )
+
+    async def run_async(
+        self,
+        script: str | None = None,
+        binary: str | None = None,
+        *args,
+        **kwargs,
+    ) -> Tuple[str, int]:
+        """
+        Run a Python script in Blender without blocking the event loop.
+
+        Takes the same arguments as `run`, so several Blender processes
+        can run side by side, see `run_many`. Blender is always started
+        and the output is always returned at once, so `inproc` is ignored
+        and `stream` is not supported. `binary` only applies to this run,
+        and the exit status is returned instead of set on `returncode`.
+
+        Returns:
+            Tuple[str, int]: Terminal output and exit status of Blender.
+        """
+        if kwargs.get("stream", False):
+            raise ValueError("run_async does not support stream=True.")
+
+        capture = kwargs.get("capture_output", True)
+        process = await create_subprocess_exec(
+            *self._command(binary or self.app, script, *args, **kwargs),
+            stdin=PIPE,
+            stdout=PIPE if capture else DEVNULL,
+            stderr=STDOUT if capture else DEVNULL,
+            close_fds=False,
+        )
+        output, _ = await process.communicate()
+        return output.decode("utf-8") if output else "", process.returncode
+
+    async def run_many(
+        self, scripts: Iterable[str], concurrency: int | None = None, **kwargs
+    ) -> List[Tuple[str, int]]:
+        """
+        Run several Python scripts in Blender concurrently.
+
+        Args:
+            scripts (iterable): The locations of your scripts.
+            concurrency (int): Maximum number of Blender processes at once.
+                        Defaults to the number of CPUs.
+            kwargs (dict): Optional Blender settings, see `run`.
+
+        Returns:
+            List[Tuple[str, int]]: The terminal output and exit status of
+                        every script, in order.
+        """
+        semaphore = Semaphore(concurrency or cpu_count() or 1)
+
+        async def bounded(script: str) -> Tuple[str, int]:
+            async with semaphore:
+                return await self.run_async(script, **kwargs)
+
+        return await gather(*(bounded(script) for script in scripts))
+
+    def _run_inproc(self, script: str, *args) -> str:
+        """Execute a script with the imported `bpy` module, see `run`.
+
+        Errors are reported like Blender does: a traceback in the output,
+        and the code of a `sys.exit` in `returncode`.
+        """
+        code = compile(Path(script).read_bytes(), script, "exec")
+        output = StringIO()
+        original = argv[:]
+        argv[:] = [self.app, script, "--", *args]
+        self.returncode = 0
+
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                try:
+                    exec(code, {"__name__": "__main__", "__file__": script})
+                except SystemExit as error:
+                    if error.code is None or isinstance(error.code, int):
+                        self.returncode = error.code or 0
+                    else:
+                        print(error.code, file=output)
+                        self.returncode = 1
+                except Exception:
+                    print_exc()
+        finally:
+            argv[:] = original
+
+        return output.getvalue()
+
+    def _use_inproc(self, **kwargs) -> bool:
+        """Whether `run` can execute the script in-process with these settings."""
+        return bool(
+            self._inproc
+            and kwargs.get("inproc", True)
+            and kwargs.get("headless", True)
+            and kwargs.get("python", True)
+            and not kwargs.get("audio", False)
+        )
+
+    def _script(self, script: str | None) -> str:
+        """Resolve the path of a script, adding the '.py' suffix."""
+        if script is None:
             raise ValueError("Provide either a local or external (gist) script source.")
 
-        gui = "-b" if kwargs.get("headless", True) else ""
-        runtime = "-P" if kwargs.get("python", True) else ""
-        audio = "-noaudio" if not kwargs.get("audio", False) else ""
-        python_args = " ".join(args)
+        if not script.endswith(".py"):
+            script += ".py"
 
-        return self.terminal(
-            f"{self.app} {audio} {gui} {runtime} {script} -- {python_args}"
+        return script
+
+    def _command(
+        self, app: str, script: str | None, *args, **kwargs
+    ) -> List[str]:
+        """Build the Blender command for a script, see `run`."""
+        script = self._script(script)
+
+        key = (
+            bool(kwargs.get("headless", True)),
+            bool(kwargs.get("python", True)),
+            bool(kwargs.get("audio", False)),
+            bool(kwargs.get("quiet", True)),
         )
+        flags = self._flag_cache.get(key)
+        if flags is None:
+            headless, python, audio, quiet = key
+            options = (("-noaudio", not audio), ("-b", headless), ("-P", python))
+            flags = ("--quiet",) if quiet else ()
+            flags += tuple(flag for flag, enabled in options if enabled)
+            self._flag_cache[key] = flags
+
+        return [self._executable(app), *flags, script, "--", *args]
+
+    def _executable(self, app: str) -> str:
+        """Resolve the Blender binary to a full path, once per binary.
+
+        `Popen` only launches through `posix_spawn` given a path with a
+        directory, so 'blender' is looked up on the PATH here.
+        """
+        if app not in self._executables:
+            self._executables[app] = which(app) or app
+        return self._executables[app]
 
     def run_gist(
-        self, gid: String, content: String | Iterable | None = None, **kwargs
+        self, gid: str, content: str | Iterable | None = None, **kwargs
     ) -> str:
         """Run a Python Blender script directly from a GitHub gist source.
 
+        The script is kept next to the cached Gist when a `cache_dir` is
+        set, otherwise it is written to a temporary file.
+
         Args:
             gid (str): UUID of the desired Gist from GitHub.
+            content (...): The target content to use in Blender: a key or
+                        key path into the Gist JSON, e.g.
+                        ['files', 'script.py', 'content']. Defaults to the
+                        content of the Gist's only file.
+            kwargs (dict): Any kwargs you wish to pass into NamedTemporaryFile,
+                        e.g. `dir` or `prefix`. A `suffix` goes before '.py'.
+                        Ignored for scripts kept in the `cache_dir`.
+
+        Returns:
+            str: the terminal output after Blender closed.
+        """
+        gid = str(gid)
+        text = self._gist_content(self.get_gist(gid), content)
+
+        with self._gist_scripts([gid], [text], **kwargs) as (fp,):
+            return self.run(fp)
+
+    def run_gists(
+        self,
+        gids: Iterable[str],
+        content: str | Iterable | None = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> List[Tuple[str, int]]:
+        """Run several Gists, downloading them concurrently.
+
+        The Gists are fetched in a thread pool over the shared connection
+        pool, then run in Blender one after the other. Their scripts are
+        stored like in `run_gist`.
+
+        Args:
+            gids (iterable): UUIDs of the desired Gists from GitHub.
             content (...): The target content to use in Blender.
-            kwargs (dict): Any kwargs you wish to pass into TempDir.
+            max_workers (int): Maximum number of concurrent downloads.
+            kwargs (dict): Any kwargs you wish to pass into NamedTemporaryFile,
+                        see `run_gist`.
 
         Returns:
-            String: the terminal output after Blender closed.
+            List[Tuple[str, int]]: The terminal output and exit status of
+                        every Gist, in order.
         """
-        with TemporaryDirectory(**kwargs) as temp:
+        gids = [str(gid) for gid in gids]
 
-            gist = self.get_gist(gid)
-            fp = f"{temp}/{gid}"
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            gists = list(executor.map(self.get_gist, gids))
 
-            if content is None:
-                text = gist
-            elif isinstance(content, str):
-                text = gist.get(content, None)
-            elif isinstance(content, Iterable):
-                text = self.extract_dict_value(gist, content)
+        texts = [self._gist_content(gist, content) for gist in gists]
+        with self._gist_scripts(gids, texts, **kwargs) as scripts:
+            return [(self.run(fp), self.returncode) for fp in scripts]
+
+    @contextmanager
+    def _gist_scripts(
+        self, gids: List[str], texts: List[str | bytes], **kwargs
+    ) -> Iterator[List[str]]:
+        """Write Gist scripts to the `cache_dir`, or else to temporary files
+        that are removed afterwards. See `run_gist` for the kwargs.
+        """
+        suffix = f"{kwargs.pop('suffix', '')}.py"
+        scripts: List[str] = []
+        temporary: List[Path] = []
+
+        try:
+            for gid, text in zip(gids, texts):
+                fp = self._cache_script(gid, text)
+                if fp is None:
+                    if isinstance(text, str):
+                        text = text.encode("utf-8")
+                    with NamedTemporaryFile(
+                        suffix=suffix, delete=False, **kwargs
+                    ) as opened:
+                        fp = Path(opened.name)
+                        temporary.append(fp)
+                        opened.write(text)
+                scripts.append(str(fp))
+
+            yield scripts
+        finally:
+            for fp in temporary:
+                fp.unlink(missing_ok=True)
+
+    def _gist_content(
+        self, gist: Dict[str, Any], content: str | Iterable | None
+    ) -> Any:
+        """Select the script text of a downloaded Gist.
+
+        Without `content`, the Gist must hold a single file, whose content is used.
+        """
+        if content is None:
+            files = list((gist.get("files") or {}).values())
+            if len(files) != 1:
+                raise ValueError(
+                    f"The Gist has {len(files)} files, pass `content` to pick one."
+                )
+            text = files[0].get("content")
+        elif isinstance(content, str):
+            text = gist.get(content, None)
+        elif isinstance(content, Iterable):
+            text = self.extract_dict_value(gist, content)
+
+        if text is None:
+            raise ValueError(f"Could not find any content under {content}.")
+        if not isinstance(text, (str, bytes)):
+            raise ValueError(f"The content under {content} is not a script.")
+
+        return text
+
+    def _cache_script(self, gid: str, text: str | bytes) -> Path | None:
+        """Write a Gist script into the cache directory, if there is one."""
+        if self.cache_dir is None:
+            return None
 
-            if text is None:
-                raise ValueError(f"Could not find any content under {content}.")
+        fp = self.cache_dir / f"{gid}.py"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_script(fp, text)
+        except OSError:
+            return None
 
-            with open(fp, "r") as opened:
-                opened.writelines(text)
+        return fp
 
-            return self.run(fp)
+    def _write_script(self, fp: Path, text: str | bytes) -> None:
+        """Write a script in one go, raw Gists may be bytes."""
+        if isinstance(text, bytes):
+            fp.write_bytes(text)
+        else:
+            fp.write_text(text, encoding="utf-8")
 
 
 class BlenderParser(ArgumentParser):
@@ -13,8 +13,12 @@ class Remove(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        for obj in context.selected_objects:
-            bpy.data.objects.remove(obj)
+        selected = tuple(context.selected_objects)
+        if hasattr(bpy.data, "batch_remove"):
+            bpy.data.batch_remove(ids=selected)
+        else:
+            for obj in selected:
+                bpy.data.objects.remove(obj)
         return {"FINISHED"}
 
     def invoke(self, context, event):